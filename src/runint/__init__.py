@@ -1 +0,0 @@
-from runint.benchmarks.nlp import translation
\ No newline at end of file
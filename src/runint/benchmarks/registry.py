@@ -1,16 +1,28 @@
-from typing import Dict, Type, Any, Optional
-from .base import BaseBenchmark
+import importlib
+from typing import Dict, Type, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import BaseBenchmark
 
 # Stores the actual class references
-_BENCHMARK_REGISTRY: Dict[str, Type[BaseBenchmark]] = {}
+_BENCHMARK_REGISTRY: Dict[str, Type["BaseBenchmark"]] = {}
 # Stores metadata (description, default config) for the UI/CLI
 _BENCHMARK_METADATA: Dict[str, Dict[str, Any]] = {}
 
+# Bundled benchmarks, imported on first lookup so that importing runint stays cheap
+_BUILTIN_MODULES = (
+    "runint.benchmarks.nlp.translation",
+)
+
+def _load_builtin_benchmarks():
+    for module in _BUILTIN_MODULES:
+        importlib.import_module(module)
+
 def register_benchmark(name: str, task_type: str, description: str):
     """
     Decorator to register a benchmark class.
     """
-    def decorator(cls: Type[BaseBenchmark]):
+    def decorator(cls: Type["BaseBenchmark"]):
         if name in _BENCHMARK_REGISTRY:
             raise ValueError(f"Benchmark '{name}' is already registered.")
             
@@ -25,7 +37,9 @@ def register_benchmark(name: str, task_type: str, description: str):
     return decorator
 
 def list_benchmarks() -> Dict[str, Dict[str, Any]]:
+    _load_builtin_benchmarks()
     return _BENCHMARK_METADATA
 
-def get_benchmark_class(name: str) -> Optional[Type[BaseBenchmark]]:
+def get_benchmark_class(name: str) -> Optional[Type["BaseBenchmark"]]:
+    _load_builtin_benchmarks()
     return _BENCHMARK_REGISTRY.get(name)
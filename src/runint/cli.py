@@ -1,22 +1,40 @@
 import typer
-import json
 import os
-from typing import Annotated
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
+from functools import lru_cache
+from typing import Annotated, Optional, TYPE_CHECKING
 
-# Import internal modules
-from runint.benchmarks.registry import list_benchmarks, get_benchmark_class
-from runint.runtime.manager import RuntimeManager
-from runint.schemas.config import RunConfig
+if TYPE_CHECKING:
+    from runint.schemas.config import RunConfig
+
+# Rich, pydantic and the runtime modules are imported inside the commands,
+# so that `--help` and shell completion don't pay for them.
 
 app = typer.Typer(help="RunInt: AI Runtime & Benchmark Intelligence CLI", pretty_exceptions_show_locals=False)
-console = Console()
+
+@lru_cache(maxsize=None)
+def _get_console():
+    from rich.console import Console
+    return Console()
+
+@lru_cache(maxsize=8)
+def _load_config(path: str, mtime: float) -> "RunConfig":
+    """
+    Parses and validates a run configuration file.
+    The mtime is part of the cache key, so edits to the file invalidate the entry.
+    """
+    from runint.schemas.config import RunConfig
+
+    with open(path, 'rb') as f:
+        return RunConfig.model_validate_json(f.read())
 
 @app.command()
 def info():
     """List available benchmarks."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from runint.benchmarks.registry import list_benchmarks
+
+    console = _get_console()
     console.print(Panel.fit("[bold cyan]RunInt Library v0.0.1[/bold cyan]", border_style="cyan"))
     benchmarks = list_benchmarks()
     if benchmarks:
@@ -33,11 +51,13 @@ def info():
 @app.command()
 def deploy(
     config: Annotated[str, typer.Option(help="Path to the JSON run configuration file")],
-    dry_run: Annotated[bool, typer.Option(help="Generate deployment files without starting them")] = False
+    dry_run: Annotated[bool, typer.Option(help="Generate deployment files without starting them")] = False,
+    health_timeout: Annotated[Optional[float], typer.Option(help="Seconds to wait for the engine to become healthy (default depends on the engine)")] = None
 ):
     """
     [Run Intelligence] Deploys an AI environment based on a configuration file.
     """
+    console = _get_console()
     # The variable 'config' automatically becomes the flag '--config'
     if not os.path.exists(config):
         console.print(f"[bold red]Error:[/bold red] Config file '{config}' not found.")
@@ -46,19 +66,31 @@ def deploy(
     console.print(f"[bold blue]Loading configuration from {config}...[/bold blue]")
     
     try:
-        with open(config, 'r') as f:
-            data = json.load(f)
-            run_config = RunConfig(**data)
-            
-        manager = RuntimeManager(run_config)
+        run_config = _load_config(config, os.path.getmtime(config))
         output_file = "docker-compose.yml"
-        manager.generate_deployment(output_path=output_file)
-        console.print(f"[green]✔ Deployment file generated at: {output_file}[/green]")
-        
-        if not dry_run:
+
+        if dry_run:
+            # Only the file is wanted, so the manager (and its HTTP session) is never set up
+            from runint.runtime.deploy.generators import DockerComposeGenerator
+
+            DockerComposeGenerator(run_config).write(output_file)
+            console.print(f"[green]✔ Deployment file generated at: {output_file}[/green]")
+            return
+
+        from runint.runtime.manager import RuntimeManager
+
+        manager = RuntimeManager(run_config)
+        try:
+            manager.generate_deployment(output_path=output_file)
+            console.print(f"[green]✔ Deployment file generated at: {output_file}[/green]")
+
             console.print("[yellow]Starting environment...[/yellow]")
-            manager.start_environment()
+            manager.start_environment(health_timeout=health_timeout)
+            console.print("[yellow]Pulling models...[/yellow]")
+            manager.execute_models()
             console.print("[bold green]✔ Environment is up and running![/bold green]")
+        finally:
+            manager.close()
             
     except Exception as e:
         console.print(f"[bold red]Deployment failed:[/bold red] {e}")
@@ -75,6 +107,10 @@ def benchmark(
     """
     [Benchmark Intelligence] Runs a specific benchmark.
     """
+    from rich.table import Table
+    from runint.benchmarks.registry import get_benchmark_class
+
+    console = _get_console()
     cls = get_benchmark_class(task)
     if not cls:
         console.print(f"[bold red]Error:[/bold red] Benchmark '{task}' not found.")
@@ -1,46 +1,236 @@
-import yaml
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
 from ..engines.ollama import OllamaEngine
 from ..engines.vllm import VLLMEngine
 from ...schemas.config import RunConfig
 
+# Engine class per provider, the compose service is named after the provider
+_ENGINES = {
+    "ollama": OllamaEngine,
+    "vllm": VLLMEngine,
+}
+
+# Generated YAML per config hash, least recently used entries are evicted first.
+# Only library callers that build many generators in one process benefit,
+# the CLI renders a single file per invocation.
+_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_CACHE_SIZE = 32
+# First line of every written compose file, identifies the generated content
+_HASH_HEADER = "# runint-hash: {key}\n"
+
+# Pre-rendered compose skeletons for the built-in engines.
+# Every leaf comes from the engine service config, the templates only fix the layout,
+# which matches what yaml.dump produces for the same structure.
+_GPU_BLOCK = """\
+    deploy:
+      resources:
+        reservations:
+          devices:
+          - driver: nvidia
+            count: {gpu_count}
+            capabilities:
+            - gpu
+"""
+
+_FAST_TEMPLATES = {
+    "ollama": """\
+services:
+  ollama:
+    image: {image}
+    ports:
+{ports}    volumes:
+{volumes}    restart: {restart}
+{gpu_block}{named_volumes}""",
+    "vllm": """\
+services:
+  vllm:
+    image: {image}
+    ports:
+{ports}    runtime: {runtime}
+    environment:
+{environment}    volumes:
+{volumes}    command: {command}
+{gpu_block}{named_volumes}""",
+}
+
+# Service keys each template covers, in emitted order ('deploy' is optional and last)
+_FAST_TEMPLATE_KEYS = {
+    "ollama": ["image", "ports", "volumes", "restart"],
+    "vllm": ["image", "ports", "runtime", "environment", "volumes", "command"],
+}
+
+# Conservative plain-scalar check. It only has to be safe, not complete: anything PyYAML
+# might quote (indicators, document markers, ': ', ' #') or read back as another type
+# falls back to the YAML dump, so the template path never needs PyYAML itself.
+_PLAIN_SCALAR = re.compile(r"(?:[A-Za-z0-9_/$=]|~/|-(?!--)(?=\S))[\w./@${}=:~-]*(?: [\w./@${}=:~-]+)*(?<!:)", re.ASCII)
+_IMPLICIT_TYPE = re.compile(r"""
+    [-+]?[\d_.]*(?:[eE][-+]?\d+)?               # ints and floats
+  | [-+]?0[xb][\da-fA-F_]+                     # hex and binary ints
+  | [-+]?\d[\d_]*(?::[0-5]?\d)+(?:\.[\d_]*)?     # sexagesimal numbers
+  | \d{4}-.*                                    # timestamps
+  | yes|no|true|false|on|off|null|=             # bools, null, value key
+""", re.VERBOSE | re.IGNORECASE)
+# The emitter folds scalars with spaces past 80 columns, leave room for the widest key prefix
+_MAX_SPACED_LENGTH = 60
+
+def _plain(value: Any) -> Optional[str]:
+    """
+    Returns the value as the emitter would write it unquoted, or None if it may need quoting.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return str(value)
+    if not isinstance(value, str) or ": " in value or not _PLAIN_SCALAR.fullmatch(value):
+        return None
+    if _IMPLICIT_TYPE.fullmatch(value) or (" " in value and len(value) > _MAX_SPACED_LENGTH):
+        return None
+    return value
+
+def _plain_items(values: Any) -> Optional[str]:
+    """
+    Renders a non-empty list of plain scalars as block sequence lines, or None.
+    """
+    if not isinstance(values, list) or not values:
+        return None
+    items = [_plain(v) for v in values]
+    if None in items:
+        return None
+    return "".join(f"    - {item}\n" for item in items)
+
+def _gpu_reservation(count: Any) -> Dict[str, Any]:
+    return {"resources": {"reservations": {"devices": [
+        {"driver": "nvidia", "count": count, "capabilities": ["gpu"]}
+    ]}}}
+
+def _named_volumes(services: Dict[str, Dict[str, Any]]) -> Dict[str, Dict]:
+    """
+    Named volumes are mount sources that aren't host paths (e.g. Ollama's model store,
+    vLLM binds the host cache). A dict dedups while keeping the output order stable.
+    """
+    sources = (vol.partition(":")[0] for service in services.values() for vol in service.get("volumes", []))
+    return {src: {} for src in sources if "/" not in src and "~" not in src}
+
 class DockerComposeGenerator:
     def __init__(self, config: RunConfig):
         self.config = config
+        # Output only depends on the config, so its content hash identifies the result
+        self._key = hashlib.blake2b(config.model_dump_json().encode(), digest_size=16).hexdigest()
+
+    def generate_fast(self) -> str:
+        """
+        Renders the compose file from a pre-built template for the built-in engines.
+        Falls back to generate_yaml() when the service doesn't fit the template.
+        Results are cached per config hash for library callers generating repeatedly
+        in one process; a single CLI run never hits the cache.
+        """
+        if self._key in _CACHE:
+            _CACHE.move_to_end(self._key)
+            return _CACHE[self._key]
+
+        content = self._render()
+        _CACHE[self._key] = content
+        if len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+        return content
+
+    def _render(self) -> str:
+        """
+        Fills the provider template, or falls back to the YAML dump.
+        """
+        provider = self.config.engine.provider
+        template = _FAST_TEMPLATES.get(provider)
+        if template is None:
+            return self.generate_yaml()
+
+        engine_settings = self.config.engine.model_dump()
+        service = _ENGINES[provider](engine_settings).get_docker_service_config()
+
+        keys = list(service)
+        if keys and keys[-1] == "deploy":
+            keys.pop()
+        if keys != _FAST_TEMPLATE_KEYS[provider]:
+            return self.generate_yaml()
+
+        leaves = {}
+        for key in keys:
+            if isinstance(service[key], list):
+                leaves[key] = _plain_items(service[key])
+            else:
+                leaves[key] = _plain(service[key])
+
+        gpu_block = ""
+        if "deploy" in service:
+            devices = service["deploy"].get("resources", {}).get("reservations", {}).get("devices") or [{}]
+            gpu_count = _plain(devices[0].get("count"))
+            if gpu_count is None or service["deploy"] != _gpu_reservation(devices[0]["count"]):
+                return self.generate_yaml()
+            gpu_block = _GPU_BLOCK.format(gpu_count=gpu_count)
+
+        named = [_plain(name) for name in _named_volumes({provider: service})]
+        if None in leaves.values() or None in named:
+            return self.generate_yaml()
+        named_volumes = "volumes:\n" + "".join(f"  {name}: {{}}\n" for name in named) if named else ""
+
+        return template.format(gpu_block=gpu_block, named_volumes=named_volumes, **leaves)
 
     def generate_yaml(self) -> str:
         """
         Constructs the docker-compose dictionary and returns it as a YAML string.
         """
         services = {}
-        volumes = {}
         
         # Extract engine settings
         engine_settings = self.config.engine.model_dump()
         provider = self.config.engine.provider
 
-        # Select the correct Engine class
-        if provider == "ollama":
-            engine_instance = OllamaEngine(engine_settings)
-            services["ollama"] = engine_instance.get_docker_service_config()
-            # Register the volume required by Ollama
-            volumes["ollama_models"] = {}
-            
-        elif provider == "vllm":
-            engine_instance = VLLMEngine(engine_settings)
-            services["vllm"] = engine_instance.get_docker_service_config()
-            # vLLM usually binds a host path, so no named volume is needed by default
-            
-        else:
-            pass
+        # Select the correct Engine class, unknown providers get no service
+        engine_cls = _ENGINES.get(provider)
+        if engine_cls is not None:
+            services[provider] = engine_cls(engine_settings).get_docker_service_config()
 
         # Build the final structure
         compose_structure = {
             "services": services,
         }
 
+        volumes = _named_volumes(services)
+
         # Only add the volumes key if we actually have named volumes
         if volumes:
             compose_structure["volumes"] = volumes
 
+        # Only the fallback needs PyYAML; prefer the LibYAML-backed emitter when available
+        import yaml
+        try:
+            from yaml import CSafeDumper as Dumper
+        except ImportError:
+            from yaml import SafeDumper as Dumper
+
         # Return as YAML string
-        return yaml.dump(compose_structure, sort_keys=False)
+        return yaml.dump(compose_structure, Dumper=Dumper, sort_keys=False, default_flow_style=False)
+
+    def write(self, output_path: str = "docker-compose.yml"):
+        """
+        Writes the generated compose file to disk, prefixed with a hash of its content.
+        A file that already holds exactly this output is left untouched, so its mtime
+        doesn't change and Compose sees no reason to recreate anything.
+        Anything else (older runint output, hand edits, damage) is overwritten.
+        """
+        content = self.generate_fast()
+        digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+        expected = _HASH_HEADER.format(key=digest) + content
+
+        try:
+            with open(output_path, "r") as f:
+                if f.read() == expected:
+                    return
+        except (OSError, UnicodeDecodeError):
+            pass # Missing or unreadable, write it below
+
+        with open(output_path, "w") as f:
+            f.write(expected)
@@ -1,48 +1,184 @@
+import json
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
+from rich.progress import Progress
 from ..schemas.config import RunConfig
 from .deploy.generators import DockerComposeGenerator
 
 console = Console()
 
+OLLAMA_URL = "http://localhost:11434"
+VLLM_URL = "http://localhost:8000"
+# Endpoints that answer 200 once the engine accepts requests
+HEALTH_URLS = {
+    "ollama": f"{OLLAMA_URL}/",
+    "vllm": f"{VLLM_URL}/health",
+}
+# Seconds to wait for the engine to come up. vLLM only answers /health once the
+# weights are downloaded and loaded, which can take a long time on a first run.
+HEALTH_TIMEOUTS = {
+    "ollama": 120,
+    "vllm": 1800,
+}
+DEFAULT_HEALTH_TIMEOUT = 300
+# Pulls are network-bound, but registries throttle parallel downloads
+MAX_PARALLEL_PULLS = 8
+# Longest silence allowed between two reads of a pull stream (not a cap on the whole pull)
+PULL_READ_TIMEOUT = 60
+
 class RuntimeManager:
     def __init__(self, config: RunConfig):
         self.config = config
+        # One pooled session for health probes and pulls, so sockets are kept alive between calls.
+        # Only pulls (POST) are retried on gateway errors. Refused connections and the GET
+        # health probes are not retried here, the callers already loop on those with their own backoff.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_PARALLEL_PULLS,
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({"POST"})
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self):
+        """
+        Releases the pooled HTTP connections.
+        """
+        self._session.close()
 
     def generate_deployment(self, output_path: str = "docker-compose.yml"):
         """
         Generates the infrastructure configuration (Docker Compose).
         """
-        generator = DockerComposeGenerator(self.config)
-        yaml_content = generator.generate_yaml()
-        
-        with open(output_path, "w") as f:
-            f.write(yaml_content)
+        DockerComposeGenerator(self.config).write(output_path)
 
-    def start_environment(self, compose_file: str = "docker-compose.yml"):
+    def start_environment(self, compose_file: str = "docker-compose.yml", health_timeout: Optional[float] = None):
         """
-        Runs 'docker compose up -d' (V2 Standard).
+        Runs 'docker compose up -d' (V2 Standard) and waits for the engine to respond.
+        health_timeout defaults to a per-provider value (see HEALTH_TIMEOUTS).
         """
         console.print(f"[dim]Running docker compose -f {compose_file} up -d[/dim]")
-        
+        self._run_compose(compose_file, "up", "-d")
+        self._wait_for_health(timeout=health_timeout)
+
+    def _wait_for_health(self, url: Optional[str] = None, timeout: Optional[float] = None):
+        """
+        Polls the engine until it responds, backing off from 50 ms up to 1 s between probes.
+        """
+        provider = self.config.engine.provider
+        url = url or HEALTH_URLS.get(provider)
+        if url is None:
+            return
+        if timeout is None:
+            timeout = HEALTH_TIMEOUTS.get(provider, DEFAULT_HEALTH_TIMEOUT)
+
+        console.print(f"[dim]Waiting for {url} to become healthy...[/dim]")
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+
+        while time.monotonic() < deadline:
+            try:
+                if self._session.get(url, timeout=2).ok:
+                    return
+            except requests.RequestException:
+                pass # Container is still starting
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+
+        raise RuntimeError(f"Engine at {url} did not become healthy within {timeout}s")
+
+    def stop_environment(self, compose_file: str = "docker-compose.yml"):
+        """
+        Runs 'docker compose down'.
+        """
+        self._run_compose(compose_file, "down")
+
+    def _run_compose(self, compose_file: str, *args: str):
+        """
+        Invokes the Compose V2 plugin ('docker compose'), the standalone
+        'docker-compose' binary is not supported.
+        Progress output is discarded, only stderr is kept for error reporting.
+        """
         try:
             subprocess.run(
-                ["docker", "compose", "-f", compose_file, "up", "-d"], 
+                ["docker", "compose", "-f", compose_file, *args],
                 check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                close_fds=True
             )
-            
-            console.print("[dim]Waiting 5s for services to stabilize...[/dim]")
-            time.sleep(5)
-            
         except subprocess.CalledProcessError as e:
             # Decode error if possible, fallback to str
-            err_msg = e.stderr.decode() if e.stderr else str(e)
+            err_msg = e.stderr.decode(errors="replace") if e.stderr else str(e)
             raise RuntimeError(f"Docker Compose failed: {err_msg}")
         except FileNotFoundError:
              raise RuntimeError("The 'docker' command was not found. Please verify Docker is installed and in your PATH.")
 
-    def stop_environment(self, compose_file: str = "docker-compose.yml"):
-        subprocess.run(["docker", "compose", "-f", compose_file, "down"])
+    def execute_models(self, base_url: str = OLLAMA_URL):
+        """
+        Makes the configured models available on the running engine.
+        """
+        provider = self.config.engine.provider
+        model_names = [m.name for m in self.config.models]
+
+        if provider == "ollama" and model_names:
+            # Pulls are independent, so run them side by side
+            with Progress(console=console) as progress, \
+                    ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_PULLS, len(model_names))) as executor:
+                list(executor.map(lambda name: self._pull_ollama_model(name, base_url, progress), model_names))
+        # vLLM loads its model from the container command, nothing to pull
+
+    def _pull_ollama_model(
+        self,
+        model_name: str,
+        base_url: str = OLLAMA_URL,
+        progress: Optional[Progress] = None,
+        attempts: int = 3
+    ):
+        """
+        Asks Ollama to download a model, retrying with exponential backoff.
+        Status lines are streamed back and reported on the progress bar if one is given.
+        """
+        task_id = progress.add_task(f"Pulling {model_name}", total=None) if progress else None
+
+        for attempt in range(attempts):
+            try:
+                with self._session.post(
+                    f"{base_url}/api/pull",
+                    json={"name": model_name, "stream": True},
+                    stream=True,
+                    timeout=(10, PULL_READ_TIMEOUT)
+                ) as response:
+                    response.raise_for_status()
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        status = json.loads(line)
+                        if "error" in status:
+                            raise RuntimeError(f"Failed to pull model '{model_name}': {status['error']}")
+                        if progress:
+                            progress.update(task_id, description=f"{model_name}: {status.get('status', '')}")
+                            # Each layer reports its own total, the bar follows the current one
+                            if "total" in status:
+                                progress.update(task_id, total=status["total"], completed=status.get("completed", 0))
+                if progress:
+                    progress.update(task_id, total=1, completed=1)
+                return
+            except (requests.RequestException, json.JSONDecodeError) as e:
+                # Stalled streams and garbled status lines are retried like network errors
+                if attempt == attempts - 1:
+                    raise RuntimeError(f"Failed to pull model '{model_name}': {e}")
+                time.sleep(2 ** attempt)
@@ -0,0 +1,69 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from runint.cli import app
+from runint.runtime.manager import RuntimeManager
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+CONFIG = {
+    "project_name": "test",
+    "engine": {"provider": "ollama", "container_image": "ollama/ollama:latest"},
+    "models": [{"name": "llama3", "source": "ollama_library"}],
+}
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(CONFIG))
+    return path
+
+def test_dry_run_writes_file_without_manager(config_file, monkeypatch):
+    monkeypatch.setattr(RuntimeManager, "__init__", lambda *a: pytest.fail("dry run built a RuntimeManager"))
+    result = CliRunner().invoke(app, ["deploy", "--config", str(config_file), "--dry-run"])
+    assert result.exit_code == 0, result.output
+    assert "image: ollama/ollama:latest" in (config_file.parent / "docker-compose.yml").read_text()
+
+def test_dry_run_does_not_import_requests(config_file):
+    code = (
+        "import sys\n"
+        "from runint.cli import app\n"
+        f"sys.argv = ['runint', 'deploy', '--config', {str(config_file)!r}, '--dry-run']\n"
+        "try:\n"
+        "    app()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in ('requests', 'yaml', 'runint.runtime.manager') if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=config_file.parent, env={"PYTHONPATH": SRC}
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+def test_deploy_closes_manager_on_failure(config_file, monkeypatch):
+    closed = []
+
+    def fail(self, **kwargs):
+        raise RuntimeError("compose failed")
+
+    monkeypatch.setattr(RuntimeManager, "start_environment", fail)
+    monkeypatch.setattr(RuntimeManager, "close", lambda self: closed.append(self))
+    result = CliRunner().invoke(app, ["deploy", "--config", str(config_file)])
+    assert result.exit_code == 1
+    assert "compose failed" in result.output
+    assert len(closed) == 1
+
+def test_deploy_passes_health_timeout(config_file, monkeypatch):
+    seen = {}
+    monkeypatch.setattr(RuntimeManager, "start_environment", lambda self, **kwargs: seen.update(kwargs))
+    monkeypatch.setattr(RuntimeManager, "execute_models", lambda self: None)
+    result = CliRunner().invoke(app, ["deploy", "--config", str(config_file), "--health-timeout", "42"])
+    assert result.exit_code == 0, result.output
+    assert seen == {"health_timeout": 42.0}
@@ -0,0 +1,101 @@
+import itertools
+import os
+import random
+
+import yaml
+
+import pytest
+
+from runint.runtime.deploy import generators
+from runint.runtime.deploy.generators import DockerComposeGenerator, _plain
+from runint.runtime.engines.ollama import OllamaEngine
+from runint.schemas.config import RunConfig
+
+IMAGES = [
+    None, "ollama/ollama:latest", "vllm/vllm-openai:v0.4.0", "registry.example.com:5000/img@sha256:abc",
+    "yes", "123", "1.5", "a: b", "x:", "-x", "@x", "~", "~/x", "ü/img", "img #c",
+    "---x", "...x", "---", "...", "--x", ".5", ".inf", "1:30", "190:20:30", "2001-12-14", "YES", "Off", "=", "0x1f",
+]
+TOKENS = [None, "abc", "no", "a b", "t:", "${HF_TOKEN}"]
+
+def make_config(provider, image=None, gpu_count=0, token=None):
+    return RunConfig(
+        project_name="test",
+        engine={
+            "provider": provider,
+            "container_image": image,
+            "gpu_count": gpu_count,
+            "env_vars": {"HF_TOKEN": token} if token else {},
+        },
+        models=[],
+    )
+
+@pytest.mark.parametrize(
+    "provider,image,gpu_count,token",
+    list(itertools.product(["ollama", "vllm", "local_python"], IMAGES, [0, 1, 2], TOKENS)),
+)
+def test_template_matches_yaml_dump(provider, image, gpu_count, token):
+    generator = DockerComposeGenerator(make_config(provider, image, gpu_count, token))
+    assert generator._render() == generator.generate_yaml()
+
+@pytest.mark.parametrize("provider", ["ollama", "vllm"])
+def test_template_path_used_for_plain_configs(provider, monkeypatch):
+    generator = DockerComposeGenerator(make_config(provider, "img/name:1", 1, "abc"))
+    expected = generator.generate_yaml()
+    monkeypatch.setattr(DockerComposeGenerator, "generate_yaml", lambda self: pytest.fail("fell back to YAML"))
+    assert generator._render() == expected
+
+def test_plain_scalars_match_emitter():
+    # Every value the template path emits unquoted must be dumped unquoted by PyYAML too
+    rng = random.Random(0)
+    alphabet = "abcexyonulXYZ019" + "-.:/~_ @${}=#'\"!&*|>%,?[]"
+    prefixes = ["", "", "", "-", "--", "---", "...", ".", "~", "1", "0x", "0b", "2001-", "1:", "y", "n", "o", "t", "f"]
+    for _ in range(50000):
+        value = rng.choice(prefixes) + "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        if _plain(value) is not None:
+            assert yaml.safe_dump({"k": value}) == f"k: {value}\n", value
+
+@pytest.mark.parametrize("service", [
+    # Changed values the template used to hard-code
+    {"image": "img", "ports": ["8080:11434"], "volumes": ["models:/data", "cache:/cache"], "restart": "unless-stopped"},
+    # Long spaced scalars get folded by the emitter
+    {"image": "img", "ports": ["11434:11434"], "volumes": ["m:/d"], "restart": "always " + "x" * 80},
+    # Values that need quoting or differ in shape
+    {"image": "img", "ports": [], "volumes": ["m:/d"], "restart": "always"},
+    {"image": "img", "ports": [11434], "volumes": ["m:/d"], "restart": "on"},
+    {"image": "img", "ports": ["1:1"], "volumes": ["m:/d"], "restart": "always", "deploy": {"replicas": 2}},
+])
+def test_template_follows_engine_output(service, monkeypatch):
+    monkeypatch.setattr(OllamaEngine, "get_docker_service_config", lambda self: service)
+    generator = DockerComposeGenerator(make_config("ollama"))
+    assert generator._render() == generator.generate_yaml()
+
+def test_generate_fast_is_cached(monkeypatch):
+    monkeypatch.setattr(generators, "_CACHE", generators.OrderedDict())
+    config = make_config("ollama", "img/name:1")
+    first = DockerComposeGenerator(config).generate_fast()
+    monkeypatch.setattr(DockerComposeGenerator, "_render", lambda self: pytest.fail("not cached"))
+    assert DockerComposeGenerator(config).generate_fast() == first
+
+def test_write_skips_unchanged_output(tmp_path, monkeypatch):
+    output = tmp_path / "docker-compose.yml"
+    config = make_config("ollama", "img/name:1")
+    DockerComposeGenerator(config).write(str(output))
+    written = output.read_text()
+    assert written.startswith("# runint-hash: ")
+
+    # Identical content is not rewritten
+    mtime = output.stat().st_mtime_ns
+    os.utime(output, ns=(mtime - 10**9, mtime - 10**9))
+    DockerComposeGenerator(config).write(str(output))
+    assert output.stat().st_mtime_ns == mtime - 10**9
+
+    # An edited body is restored even though the header still matches
+    output.write_text(written + "# edited\n")
+    DockerComposeGenerator(config).write(str(output))
+    assert output.read_text() == written
+
+    # Same config, different generated output (e.g. after a runint upgrade)
+    monkeypatch.setattr(DockerComposeGenerator, "generate_fast", lambda self: "services: {}\n")
+    DockerComposeGenerator(config).write(str(output))
+    assert output.read_text().endswith("services: {}\n")
@@ -0,0 +1,177 @@
+import json
+import threading
+
+import pytest
+import requests
+
+from runint.runtime import manager as manager_module
+from runint.runtime.manager import RuntimeManager
+from runint.schemas.config import RunConfig
+
+def make_manager(provider="ollama", models=("llama3",)):
+    config = RunConfig(
+        project_name="test",
+        engine={"provider": provider},
+        models=[{"name": name, "source": "ollama_library"} for name in models],
+    )
+    return RuntimeManager(config)
+
+class FakeStream:
+    """Stands in for a streamed requests.Response."""
+
+    def __init__(self, lines, status_code=200):
+        self.lines = lines
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def iter_lines(self):
+        for line in self.lines:
+            if isinstance(line, Exception):
+                raise line
+            yield line if isinstance(line, bytes) else json.dumps(line).encode()
+
+SUCCESS = [{"status": "pulling manifest"}, {"status": "pulling abc", "total": 10, "completed": 10}, {"status": "success"}]
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(manager_module.time, "sleep", calls.append)
+    return calls
+
+def test_pull_requests_stream_with_finite_read_timeout(monkeypatch):
+    manager = make_manager()
+    calls = []
+
+    def post(url, **kwargs):
+        calls.append((url, kwargs))
+        return FakeStream(SUCCESS)
+
+    monkeypatch.setattr(manager._session, "post", post)
+    manager._pull_ollama_model("llama3", "http://engine")
+
+    url, kwargs = calls[0]
+    assert url == "http://engine/api/pull"
+    assert kwargs["json"] == {"name": "llama3", "stream": True}
+    assert kwargs["stream"] is True
+    assert kwargs["timeout"][1] == manager_module.PULL_READ_TIMEOUT
+
+def test_execute_models_pulls_in_parallel(monkeypatch):
+    names = ["a", "b", "c", "d"]
+    manager = make_manager(models=names)
+    # Every pull waits for all the others, so this only finishes if they run concurrently
+    barrier = threading.Barrier(len(names), timeout=5)
+    pulled = []
+
+    def post(url, json, **kwargs):
+        barrier.wait()
+        pulled.append(json["name"])
+        return FakeStream(SUCCESS)
+
+    monkeypatch.setattr(manager._session, "post", post)
+    manager.execute_models("http://engine")
+    assert sorted(pulled) == names
+
+def test_execute_models_skips_vllm(monkeypatch):
+    manager = make_manager(provider="vllm")
+    monkeypatch.setattr(manager._session, "post", lambda *a, **k: pytest.fail("vLLM has nothing to pull"))
+    manager.execute_models("http://engine")
+
+def test_pull_retries_with_backoff(monkeypatch, sleeps):
+    manager = make_manager()
+    responses = [requests.ConnectionError("refused"), FakeStream([b"not json"]), FakeStream(SUCCESS)]
+
+    def post(url, **kwargs):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(manager._session, "post", post)
+    manager._pull_ollama_model("llama3", "http://engine")
+    assert sleeps == [1, 2]
+    assert responses == []
+
+@pytest.mark.parametrize("failure", [
+    requests.ConnectionError("refused"),
+    FakeStream([], status_code=500),
+    FakeStream([{"status": "pulling abc"}, requests.exceptions.ReadTimeout("stalled")]),
+    FakeStream([b"{garbled"]),
+])
+def test_pull_gives_up_after_attempts(monkeypatch, sleeps, failure):
+    manager = make_manager()
+
+    def post(url, **kwargs):
+        if isinstance(failure, Exception):
+            raise failure
+        return failure
+
+    monkeypatch.setattr(manager._session, "post", post)
+    with pytest.raises(RuntimeError, match="Failed to pull model 'llama3'"):
+        manager._pull_ollama_model("llama3", "http://engine", attempts=3)
+    assert sleeps == [1, 2]
+
+def test_pull_error_line_is_not_retried(monkeypatch, sleeps):
+    manager = make_manager()
+    calls = []
+
+    def post(url, **kwargs):
+        calls.append(url)
+        return FakeStream([{"status": "pulling manifest"}, {"error": "file does not exist"}])
+
+    monkeypatch.setattr(manager._session, "post", post)
+    with pytest.raises(RuntimeError, match="file does not exist"):
+        manager._pull_ollama_model("missing", "http://engine")
+    assert len(calls) == 1
+    assert sleeps == []
+
+def test_wait_for_health_backs_off_until_ready(monkeypatch, sleeps):
+    manager = make_manager()
+    answers = [requests.ConnectionError("refused")] * 12 + [False, True]
+
+    class Answer:
+        def __init__(self, ok):
+            self.ok = ok
+
+    def get(url, **kwargs):
+        answer = answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return Answer(answer)
+
+    monkeypatch.setattr(manager._session, "get", get)
+    manager._wait_for_health("http://engine/", timeout=60)
+
+    assert answers == []
+    assert sleeps[0] == pytest.approx(0.05)
+    assert all(b >= a for a, b in zip(sleeps, sleeps[1:]))
+    assert max(sleeps) == 1.0
+
+def test_wait_for_health_uses_provider_timeout(monkeypatch, sleeps):
+    manager = make_manager(provider="vllm")
+    clock = iter(range(0, 10**6, 100))
+    monkeypatch.setattr(manager_module.time, "monotonic", lambda: next(clock))
+
+    def get(url, **kwargs):
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(manager._session, "get", get)
+
+    with pytest.raises(RuntimeError, match=f"within {manager_module.HEALTH_TIMEOUTS['vllm']}s"):
+        manager._wait_for_health()
+    with pytest.raises(RuntimeError, match="within 5s"):
+        manager._wait_for_health(timeout=5)
+
+def test_health_probes_are_not_retried_by_the_adapter():
+    manager = make_manager()
+    retry = manager._session.get_adapter("http://localhost:11434/").max_retries
+    assert not retry.is_retry("GET", 503)
+    assert retry.is_retry("POST", 503)
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+def run(code):
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env={"PYTHONPATH": SRC})
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+def test_importing_runint_does_not_load_benchmarks():
+    out = run(
+        "import sys, runint, runint.benchmarks.registry\n"
+        "print('runint.benchmarks.nlp.translation' in sys.modules, 'requests' in sys.modules)"
+    )
+    assert out == "False False"
+
+def test_builtin_benchmarks_load_on_lookup():
+    out = run(
+        "from runint.benchmarks.registry import list_benchmarks, get_benchmark_class\n"
+        "print(sorted(list_benchmarks()), get_benchmark_class('translation_en_de_v1').__name__)"
+    )
+    assert out == "['translation_en_de_v1'] TranslationBenchmark"